@@ -1,14 +1,19 @@
 """CLI entry point for ConvoFormatter."""
 
+from __future__ import annotations
+
+import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import yaml
 
 from convo import __version__
-from convo.parser import Turn, detect_date, detect_title, parse
-from convo.references import Reference, collect_references
+from convo.parser import Turn, mtime_date, parse, scan_head, stem_title
+
+if TYPE_CHECKING:
+    from convo.references import Reference
 
 _CONFIG_PATHS = [
     Path.home() / ".config" / "convo" / "config.yaml",
@@ -23,6 +28,34 @@ _CONFIG_KEY_MAP = {
 }
 
 
+def _read_config(path: Path) -> object:
+    """Parse a YAML config file, reusing its JSON shadow cache while the YAML is unchanged."""
+    cache_path = path.with_suffix(".yaml.jsoncache")
+    st = path.stat()
+    # Exact match, not "cache is newer": a restored backup (cp -p, rsync -a) can
+    # carry an older mtime than the config it replaces
+    stamp = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached["stamp"] == stamp:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    import yaml
+
+    with open(path) as f:
+        raw = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    # Best-effort: values JSON can't represent (e.g. YAML dates) just skip the cache
+    try:
+        cache_path.write_text(json.dumps({"stamp": stamp, "config": raw}))
+    except (OSError, TypeError, ValueError):
+        pass
+    return raw
+
+
 def _load_config() -> dict:
     """Load config from the first existing config file.
 
@@ -32,8 +65,7 @@ def _load_config() -> dict:
     for path in _CONFIG_PATHS:
         if path.exists():
             try:
-                with open(path) as f:
-                    raw = yaml.safe_load(f)
+                raw = _read_config(path)
                 if not isinstance(raw, dict):
                     return {}
                 return {_CONFIG_KEY_MAP.get(k, k): v for k, v in raw.items()}
@@ -41,6 +73,17 @@ def _load_config() -> dict:
                 return {}
     return {}
 
+
+class _ConfigCommand(click.Command):
+    """Command that loads config defaults when invoked rather than at import time."""
+
+    def make_context(self, info_name, args, parent=None, **extra) -> click.Context:
+        # Not setdefault: that would read the config even when a default_map was passed
+        if "default_map" not in extra:
+            extra["default_map"] = _load_config()
+        return super().make_context(info_name, args, parent=parent, **extra)
+
+
 _FORMAT_EXTENSIONS = {
     "pdf": ".pdf",
     "html": ".html",
@@ -99,7 +142,7 @@ def _render(
         render_text(turns, output_path, title, date, references=references)
 
 
-@click.command(context_settings={"default_map": _load_config()})
+@click.command(cls=_ConfigCommand)
 @click.argument("input_file", type=click.Path(exists=True, path_type=Path))
 @click.argument("output_file", type=click.Path(path_type=Path), required=False)
 @click.option(
@@ -168,21 +211,30 @@ def main(
             _warn(f"--mobile has no effect for --output={fmt}")
     theme = theme or "dark"  # apply default after warning check
 
-    # Read file once; parse() will also read it but needs the full text
-    head = input_file.read_text(encoding="utf-8").splitlines()[:30]
-    turns = parse(input_file, assistant_label=assistant_label, user_label=user_label, verbose=verbose)
+    # Read file once and share it between parse() and title/date detection
+    text = input_file.read_text(encoding="utf-8")
+    # splitlines() over only the first 30 "\n" lines; it can break them further
+    head = "\n".join(text.split("\n", 30)[:30]).splitlines()[:30]
+    turns = parse(
+        input_file,
+        assistant_label=assistant_label,
+        user_label=user_label,
+        verbose=verbose,
+        text=text,
+    )
 
     if not turns:
         click.echo("No conversation turns found in the input file.", err=True)
         sys.exit(1)
 
-    # Auto-detect title and date if not provided (reuse the already-read head)
-    resolved_title = title or detect_title(input_file, turns, head=head)
-    resolved_date = date or detect_date(input_file, head=head)
+    # Auto-detect title and date if not provided (one scan of the already-read head)
+    head_title, head_date = scan_head(head)
+    fallback_title = stem_title(input_file)
+    resolved_title = title or head_title or fallback_title
+    resolved_date = date or head_date or mtime_date(input_file)
 
     # If title is just a filename fallback, try generating one with Ollama
-    stem_title = input_file.stem.replace("_", " ").replace("-", " ").title()
-    if resolved_title == stem_title and turns and not no_ai:
+    if resolved_title == fallback_title and turns and not no_ai:
         from convo.titler import generate_title
         _warn("Generating title with local model...")
         generated = generate_title(turns)
@@ -196,10 +248,14 @@ def main(
         turns, summary = redact_turns(turns, use_presidio=True)
         print_privacy_warning(summary)
 
-    # Collect references (auto-detect from conversation + CLI --ref args)
-    references = collect_references(turns, list(refs) if refs else None)
-    if references:
-        _warn(f"Resolved {len(references)} reference(s)")
+    # Collect references (auto-detect from conversation + CLI --ref args);
+    # skip the scan entirely when there are no CLI refs and no URLs to find
+    references = None
+    if refs or any("http" in p for t in turns for p in t.paragraphs):
+        from convo.references import collect_references
+        references = collect_references(turns, list(refs) if refs else None)
+        if references:
+            _warn(f"Resolved {len(references)} reference(s)")
 
     output_path = _resolve_output(input_file, output_file, fmt)
     loaded_theme = _load_theme(theme)
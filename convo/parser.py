@@ -6,6 +6,8 @@ Pass 2: assemble blocks into Turn dataclasses, discarding scaffolding.
 
 from __future__ import annotations
 
+import io
+import itertools
 import re
 from dataclasses import dataclass, field
 from enum import Enum
@@ -22,48 +24,60 @@ class LineType(Enum):
     CONTINUATION = "cont"
 
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     speaker: Literal["assistant", "user"]
     paragraphs: list[str]
     speaker_label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class _Block:
     lt: LineType
     raw_lines: list[str] = field(default_factory=list)
-
-
-# Tool calls: CamelCase( patterns, "Read filepath", "Searched for", ctrl+o UI indicator
-_TOOL_CALL_RE = re.compile(
-    r"^● ("
-    r"[A-Z][a-zA-Z]+\("         # CamelCase( e.g. Bash(, Fetch(, Write(
-    r"|Read\s"                   # Read <filepath>
-    r"|Searched\b"               # Searched for...
-    r")"
+    is_noise: bool = False
+
+
+# One anchored alternation, tried in order; the named group that matched decides the type.
+# Tool calls: CamelCase( patterns, "Read filepath", "Searched for"; ctrl+o UI indicator is
+# checked separately for assistant lines.
+_CLASSIFY_RE = re.compile(
+    r"(?P<slash>❯ /\w)"            # /rename, /help, /clear, etc. — treat as noise
+    r"|(?P<user>❯ )"
+    r"|(?P<tool_call>● (?:"
+    r"[A-Z][a-zA-Z]+\("            # CamelCase( e.g. Bash(, Fetch(, Write(
+    r"|Read\s"                     # Read <filepath>
+    r"|Searched\b"                 # Searched for...
+    r"))"
+    r"|(?P<asst>● )"
+    r"|(?P<tool_output>\s*⎿)"
+    r"|\s*(?P<progress>✻ .+ for \d+)"
 )
-_PROGRESS_RE = re.compile(r"^✻ .+ for \d+")
-_TOOL_OUTPUT_RE = re.compile(r"^\s*⎿")
+
+_GROUP_TYPES = {
+    "slash": LineType.TOOL_CALL,
+    "user": LineType.USER_TURN,
+    "tool_call": LineType.TOOL_CALL,
+    "asst": LineType.ASST_TURN,
+    "tool_output": LineType.TOOL_OUTPUT,
+    "progress": LineType.PROGRESS,
+}
 
 
-_SLASH_CMD_RE = re.compile(r"^❯ /\w")
+# Every non-continuation line starts with one of these, optionally after indentation
+_MARKER_CHARS = frozenset("❯●⎿✻")
 
 
 def _classify(line: str) -> LineType:
-    if line.startswith("❯ "):
-        if _SLASH_CMD_RE.match(line):
-            return LineType.TOOL_CALL  # /rename, /help, /clear, etc. — treat as noise
-        return LineType.USER_TURN
-    if line.startswith("● "):
-        if _TOOL_CALL_RE.match(line) or "ctrl+o" in line.lower():
-            return LineType.TOOL_CALL
-        return LineType.ASST_TURN
-    if _TOOL_OUTPUT_RE.match(line):
-        return LineType.TOOL_OUTPUT
-    if _PROGRESS_RE.match(line.strip()):
-        return LineType.PROGRESS
-    return LineType.CONTINUATION
+    c0 = line[:1]
+    if c0 not in _MARKER_CHARS and not (c0.isspace() and line.lstrip()[:1] in _MARKER_CHARS):
+        return LineType.CONTINUATION
+    m = _CLASSIFY_RE.match(line)
+    if m is None:
+        return LineType.CONTINUATION
+    if m.lastgroup == "asst" and "ctrl+o" in line.lower():
+        return LineType.TOOL_CALL
+    return _GROUP_TYPES[m.lastgroup]
 
 
 def _paragraphize(raw_lines: list[str]) -> list[str]:
@@ -74,29 +88,42 @@ def _paragraphize(raw_lines: list[str]) -> list[str]:
     """
     paragraphs: list[str] = []
     current: list[str] = []
+    # current is cleared rather than rebound, so the bound append stays valid
+    add_line = current.append
 
     for line in raw_lines:
         stripped = line.strip()
         if not stripped:
             if current:
                 paragraphs.append(" ".join(current))
-                current = []
+                current.clear()
         elif stripped == "---":
             if current:
                 paragraphs.append(" ".join(current))
-                current = []
+                current.clear()
             paragraphs.append("---")
         else:
-            current.append(stripped)
+            add_line(stripped)
 
     if current:
         paragraphs.append(" ".join(current))
 
-    return [p for p in paragraphs if p]
+    # Every appended paragraph is non-empty, so no final filter is needed
+    return paragraphs
 
 
-_NOISE_TYPES = {LineType.TOOL_CALL, LineType.TOOL_OUTPUT, LineType.PROGRESS}
-_BLOCK_START_TYPES = {LineType.USER_TURN, LineType.ASST_TURN, LineType.TOOL_CALL}
+# Every block-start line begins with exactly one "❯ " or "● " marker
+_MARKER_LEN = len("❯ ")
+
+# What pass 1 does with each line type
+_LT_ACTION = {
+    LineType.USER_TURN: "start",
+    LineType.ASST_TURN: "start",
+    LineType.TOOL_CALL: "start_noise",
+    LineType.TOOL_OUTPUT: "append_noise",
+    LineType.PROGRESS: "append_noise",
+    LineType.CONTINUATION: "append",
+}
 
 
 def parse(
@@ -104,41 +131,50 @@ def parse(
     assistant_label: str = "Assistant",
     user_label: str = "User",
     verbose: bool = False,
+    text: str | None = None,
 ) -> list[Turn]:
     """Parse a Claude Code transcript file into a list of Turn objects.
 
     Scaffolding (tool calls, tool output, progress) is discarded unless verbose=True.
     Lines before the first speaker turn (ASCII art header) are silently ignored.
+    If the caller has already read the file, pass its contents as text to skip the re-read.
     """
-    text = path.read_text(encoding="utf-8")
-    raw_lines = text.splitlines()
-
-    # Pass 1: group lines into blocks
+    # Pass 1: group lines into blocks, streaming the file rather than loading it whole
     blocks: list[_Block] = []
     current: _Block | None = None
 
-    for line in raw_lines:
-        lt = _classify(line)
-
-        if lt in _BLOCK_START_TYPES:
-            current = _Block(lt=lt, raw_lines=[line[2:]])  # strip "❯ " or "● "
-            blocks.append(current)
-
-        elif lt in (LineType.TOOL_OUTPUT, LineType.PROGRESS):
-            # Only append to noise blocks (tool calls); discard if attached to a speaker turn
-            if current is not None and current.lt in _NOISE_TYPES:
-                current.raw_lines.append(line)
-
-        else:  # CONTINUATION
-            if current is not None:
-                current.raw_lines.append(line)
-            # else: pre-conversation header lines — discard
+    if text is not None:
+        source = io.StringIO(text)
+    else:
+        source = path.open(encoding="utf-8", errors="replace")
+    with source as f:
+        # File iteration only breaks on "\n"; splitlines() on each piece also breaks on
+        # \v, \f, \x1c-\x1e, \x85 and U+2028/2029, as splitting the whole text did
+        for line in itertools.chain.from_iterable(map(str.splitlines, f)):
+            lt = _classify(line)
+            action = _LT_ACTION[lt]
+
+            if action == "append":
+                if current is not None:
+                    current.raw_lines.append(line)
+                # else: pre-conversation header lines — discard
+
+            elif action == "append_noise":
+                # Only append to noise blocks (tool calls); discard if attached to a speaker turn
+                if current is not None and current.is_noise:
+                    current.raw_lines.append(line)
+
+            else:  # start / start_noise
+                current = _Block(
+                    lt=lt, raw_lines=[line[_MARKER_LEN:]], is_noise=action == "start_noise"
+                )
+                blocks.append(current)
 
     # Pass 2: assemble into Turn objects
     turns: list[Turn] = []
 
     for block in blocks:
-        if block.lt in _NOISE_TYPES and not verbose:
+        if block.is_noise and not verbose:
             continue
 
         speaker: Literal["assistant", "user"] = (
@@ -153,43 +189,66 @@ def parse(
     return turns
 
 
+# Session notes heading, e.g. "# Debugging the parser"
+_TITLE_RE = re.compile(r"^\s*#\s+(\S.*?)\s*$")
+
+# ISO "YYYY-MM-DD" or written "Month DD, YYYY"
+_DATE_RE = re.compile(
+    r"\b(?P<iso>\d{4}-\d{2}-\d{2})\b"
+    r"|\b(?P<written>(?:January|February|March|April|May|June|July|August|September|"
+    r"October|November|December)\s+\d{1,2},?\s+\d{4})\b"
+)
+
+
+def _read_head(path: Path, n: int = 30) -> list[str]:
+    """Read only the first n lines of a file, split as str.splitlines() would."""
+    with path.open(encoding="utf-8", errors="replace") as f:
+        return list(itertools.islice(itertools.chain.from_iterable(map(str.splitlines, f)), n))
+
+
+def scan_head(head: list[str]) -> tuple[str | None, str | None]:
+    """Find a "# Title" heading and a date in the head lines in a single pass.
+
+    Returns (title, date); either is None when not present. ISO dates win over
+    written ones anywhere in the head.
+    """
+    title = iso = written = None
+    for line in head:
+        if title is None:
+            m = _TITLE_RE.match(line)
+            if m:
+                title = m.group(1)
+        if iso is None:
+            for m in _DATE_RE.finditer(line):
+                if m.lastgroup == "iso":
+                    iso = m.group("iso")
+                    break
+                if written is None:
+                    written = m.group("written")
+        if title is not None and iso is not None:
+            break
+    return title, iso or written
+
+
+def stem_title(path: Path) -> str:
+    """Title-case the filename stem, used when the transcript has no heading."""
+    return path.stem.replace("_", " ").replace("-", " ").title()
+
+
+def mtime_date(path: Path) -> str:
+    """Format the file modification time as YYYY-MM-DD."""
+    import datetime
+
+    return datetime.datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y-%m-%d")
+
+
 def detect_title(path: Path, turns: list[Turn], head: list[str] | None = None) -> str:
     """Infer a title from the transcript, falling back to the filename stem."""
-    # Look for a session notes title in the first 30 lines
-    text_head = head if head is not None else path.read_text(encoding="utf-8").splitlines()[:30]
-    for line in text_head:
-        m = re.match(r"^#\s+(.+)", line.strip())
-        if m:
-            return m.group(1).strip()
-
-    # Fall back to filename stem, title-cased
-    stem = path.stem.replace("_", " ").replace("-", " ")
-    return stem.title()
+    text_head = head if head is not None else _read_head(path)
+    return scan_head(text_head)[0] or stem_title(path)
 
 
 def detect_date(path: Path, head: list[str] | None = None) -> str:
     """Extract a date from the transcript, falling back to file modification time."""
-    import datetime
-
-    text_head = head if head is not None else path.read_text(encoding="utf-8").splitlines()[:30]
-
-    # ISO date pattern: YYYY-MM-DD
-    iso_re = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
-    for line in text_head:
-        m = iso_re.search(line)
-        if m:
-            return m.group(1)
-
-    # Written date: "Month DD, YYYY"
-    written_re = re.compile(
-        r"\b(January|February|March|April|May|June|July|August|September|"
-        r"October|November|December)\s+\d{1,2},?\s+\d{4}\b"
-    )
-    for line in text_head:
-        m = written_re.search(line)
-        if m:
-            return m.group(0)
-
-    # Fall back to file mtime
-    mtime = path.stat().st_mtime
-    return datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
+    text_head = head if head is not None else _read_head(path)
+    return scan_head(text_head)[1] or mtime_date(path)
@@ -6,21 +6,125 @@ Layer 2 (requires presidio extra): NLP-based entity detection via Microsoft Pres
 
 from __future__ import annotations
 
+import hashlib
 import re
 import sys
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from convo.parser import Turn
+from convo.regex import load_engine
+
+# RE2 when installed, used only on ASCII text (see _fuse)
+_re_engine = load_engine()
 
 # ── Layer 1: regex patterns ────────────────────────────────────────────────
 
-_REGEX_RULES: list[tuple[re.Pattern, str]] = [
+_REGEX_RULES: tuple[tuple[re.Pattern, str], ...] = (
     (re.compile(r"sk-[a-zA-Z0-9]{20,}"), "[REDACTED_KEY]"),
     (re.compile(r"Bearer [a-zA-Z0-9\-._~+/]+=*"), "[REDACTED_KEY]"),
-    (re.compile(r"(?i)password\s*[:=]\s*\S+"), "[REDACTED_PASSWORD]"),
+    # Run one after another, the Bearer rule replaced any token inside the value before
+    # this rule matched. In one leftmost match, \S+ would stop at the token's space
+    # instead, so a Bearer token counts as part of the value.
+    (
+        re.compile(r"(?i:password)\s*[:=]\s*(?:Bearer [a-zA-Z0-9\-._~+/]+|\S)+"),
+        "[REDACTED_PASSWORD]",
+    ),
     (re.compile(r"\b\d{3}-\d{2}-\d{4}\b"), "[REDACTED_SSN]"),
     (re.compile(r"\b\d{4}[\s\-]\d{4}[\s\-]\d{4}[\s\-]\d{4}\b"), "[REDACTED_CARD]"),
-]
+)
+
+
+# The ASCII characters Python's \s matches; RE2's \s leaves out \v and \x1c-\x1f
+_ASCII_SPACE = r"\t\n\x0b\f\r\x1c-\x1f "
+
+
+def _ascii_classes(pattern: str) -> str:
+    """Spell out \\s and \\S (bare, or opening a class) as Python's ASCII whitespace."""
+    return (
+        pattern.replace(r"[\s", "[" + _ASCII_SPACE)
+        .replace(r"\s", f"[{_ASCII_SPACE}]")
+        .replace(r"\S", f"[^{_ASCII_SPACE}]")
+    )
+
+
+def _fuse(indices, engine=re) -> re.Pattern:
+    """One alternation over the given rules; the matching group's index picks the replacement.
+
+    Other engines get a bytes pattern for ASCII text, where their ASCII-only \\d and \\b
+    agree with the stdlib engine's and \\s is spelled out to agree too.
+    """
+    pattern = "|".join(f"(?P<r{i}>{_REGEX_RULES[i][0].pattern})" for i in indices)
+    if engine is re:
+        return re.compile(pattern)
+    return engine.compile(_ascii_classes(pattern).encode("ascii"))
+
+
+# The key rule (first) still runs on its own before the rest, as when every rule ran
+# in turn: a key replaced inside a Bearer token or password value ends it there, so a
+# token after the key is matched on its own rather than swallowed or left behind
+_KEY_RE = _fuse([0])
+# The remaining rules fused so each paragraph is scanned once more
+_FUSED_RULES = range(1, len(_REGEX_RULES))
+_COMBINED_RE = _fuse(_FUSED_RULES)
+# Text without a digit can't match the SSN or card rules (both need \d), so it's
+# scanned with the smaller alternation of the remaining rules
+_KEYWORD_RULES = [i for i in _FUSED_RULES if r"\d" not in _REGEX_RULES[i][0].pattern]
+_DIGIT_RULES = [i for i in _FUSED_RULES if i not in _KEYWORD_RULES]
+_KEYWORD_RE = _fuse(_KEYWORD_RULES)
+_GROUP_REPLACEMENTS = {f"r{i}": replacement for i, (_, replacement) in enumerate(_REGEX_RULES)}
+
+# RE2 only sees ASCII text, as bytes: that matches the stdlib patterns (see _fuse) and
+# skips mapping every match offset back from UTF-8. Any other text takes the stdlib
+# patterns, as does everything without RE2.
+_BYTES_PATTERNS: dict[re.Pattern, re.Pattern] = {}
+if _re_engine is not re:
+    _BYTES_PATTERNS[_KEY_RE] = _fuse([0], _re_engine)
+    _BYTES_PATTERNS[_COMBINED_RE] = _fuse(_FUSED_RULES, _re_engine)
+    _BYTES_PATTERNS[_KEYWORD_RE] = _fuse(_KEYWORD_RULES, _re_engine)
+# Bytes matches may report lastgroup as str or bytes depending on the engine
+_BYTE_REPLACEMENTS = {
+    key: replacement.encode("ascii")
+    for name, replacement in _GROUP_REPLACEMENTS.items()
+    for key in (name, name.encode("ascii"))
+}
+
+# Hyperscan (optional) checks in one DFA pass whether any digit rule matches at all,
+# so paragraphs that merely contain numbers skip the regex engine. It only screens;
+# the regex engine still does the redaction.
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+
+def _digit_rules_db():
+    if _hyperscan is None:
+        return None
+    rules = [_ascii_classes(_REGEX_RULES[i][0].pattern).encode("ascii") for i in _DIGIT_RULES]
+    db = _hyperscan.Database()
+    try:
+        db.compile(
+            expressions=rules,
+            ids=list(range(len(rules))),
+            elements=len(rules),
+            flags=[_hyperscan.HS_FLAG_SINGLEMATCH] * len(rules),
+        )
+    except _hyperscan.error:
+        return None
+    return db
+
+
+_DIGIT_RULES_DB = _digit_rules_db()
+_hs_local = threading.local()
+
+# Cheap screens: the keyword rules need one of these literals or "password" in any
+# case; the others need a digit
+_TRIGGER_LITERALS = ("sk-", "Bearer ")
+_DIGITS = "0123456789"
+_DIGIT_RE = re.compile(r"\d")
 
 # Presidio entity → replacement token
 _PRESIDIO_REPLACEMENTS = {
@@ -36,26 +140,149 @@ _PRESIDIO_REPLACEMENTS = {
 
 _LOW_CONFIDENCE_THRESHOLD = 0.75
 
-
-@dataclass
+# Paragraphs skip Presidio unless they're at least this long and contain a capital
+# letter (names, places, organisations), a digit (phone, card, licence) or an '@'
+# (email). Everything else, like "ok" or "---", has nothing NER would find. The floor
+# is deliberately low: at 20 characters, short turns such as "Thanks, Alice" or
+# "I'm Bob Smith" would keep their names.
+_PRESIDIO_MIN_CHARS = 3
+_ENTITY_HINT_RE = re.compile(r"[@\d]")
+
+# Joins paragraphs for one batched pass: a blank-line-delimited record-separator
+# symbol, which never appears in normal transcript text. Text containing the symbol
+# at all is processed paragraph by paragraph, since even part of a separator at a
+# paragraph's edge would make the split ambiguous.
+_PARA_SEP_MARK = "\u241e"
+_PARA_SEP = f"\n{_PARA_SEP_MARK}\n"
+
+# Presidio results keyed by a digest of the analyzed text, so repeated turns and
+# paragraphs (echoed prompts, boilerplate) skip spaCy. Bounded LRU.
+_PresidioResult = tuple[str, dict[str, int], list[tuple[str, str, float]]]
+_PRESIDIO_CACHE: OrderedDict[bytes, _PresidioResult] = OrderedDict()
+_PRESIDIO_CACHE_SIZE = 4096
+
+# Paragraphs past this size (pasted logs, dumps) rarely repeat; caching them would
+# only pin megabytes of text and its redacted copy in the LRU
+_REGEX_CACHE_MAX_CHARS = 65536
+
+
+@dataclass(slots=True)
 class RedactionSummary:
     entity_counts: dict[str, int]
     low_confidence_items: list[tuple[str, str, float]]  # (original, replacement, score)
     regex_count: int
 
 
+def _replacement_for(match) -> str:
+    return _GROUP_REPLACEMENTS[match.lastgroup]
+
+
+def _byte_replacement_for(match) -> bytes:
+    return _BYTE_REPLACEMENTS[match.lastgroup]
+
+
+def _has_digit(text: str) -> bool:
+    """Substring checks run far faster than a regex search (or translate) over clean text."""
+    if text.isascii():
+        return any(map(text.__contains__, _DIGITS))
+    # \d can match non-ASCII digits too
+    return _DIGIT_RE.search(text) is not None
+
+
+def _has_keyword(text: str) -> bool:
+    return any(map(text.__contains__, _TRIGGER_LITERALS)) or "password" in text.casefold()
+
+
+def _stop_scan(*_) -> bool:
+    return True
+
+
+def _digit_rules_match(text: str) -> bool:
+    """Whether an SSN or card rule could match; always True without Hyperscan.
+
+    Like RE2, Hyperscan's \\d and \\b are ASCII-only, so other text isn't screened.
+    """
+    if _DIGIT_RULES_DB is None or not text.isascii():
+        return True
+    # Scratch space can't be shared between concurrent scans
+    scratch = getattr(_hs_local, "scratch", None)
+    if scratch is None:
+        scratch = _hs_local.scratch = _hyperscan.Scratch(_DIGIT_RULES_DB)
+    try:
+        _DIGIT_RULES_DB.scan(text.encode("ascii"), match_event_handler=_stop_scan, scratch=scratch)
+    except _hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+# Transcripts repeat paragraphs (echoed prompts, boilerplate replies); the result
+# depends only on the text, so identical paragraphs are redacted once
+@lru_cache(maxsize=4096)
 def _apply_regex(text: str) -> tuple[str, int]:
     """Apply regex redaction rules. Returns (redacted_text, match_count)."""
+    if _has_digit(text):
+        # A keyword redaction can give a card or SSN the word boundary it lacked, so
+        # text with a keyword always takes the full pattern
+        if not _digit_rules_match(text) and not _has_keyword(text):
+            return text, 0
+        pattern, rescan = _COMBINED_RE, True
+    elif _has_keyword(text):
+        pattern, rescan = _KEYWORD_RE, False
+    else:
+        return text, 0
+    key_pattern = _KEY_RE if "sk-" in text else None
+    bytes_pattern = _BYTES_PATTERNS.get(pattern)
+    if bytes_pattern is not None and text.isascii():
+        data, count = _substitute(
+            bytes_pattern,
+            _BYTES_PATTERNS.get(key_pattern),
+            _byte_replacement_for,
+            text.encode("ascii"),
+            rescan,
+        )
+        return (data.decode("ascii"), count) if count else (text, 0)
+    return _substitute(pattern, key_pattern, _replacement_for, text, rescan)
+
+
+def _substitute(pattern, key_pattern, replacement_for, text, rescan: bool):
     count = 0
-    for pattern, replacement in _REGEX_RULES:
-        new_text, n = pattern.subn(replacement, text)
+    if key_pattern is not None:
+        text, count = key_pattern.subn(replacement_for, text)
+    text, n = pattern.subn(replacement_for, text)
+    count += n
+    if not rescan:
+        return text, count
+    while n:
+        # A replacement token's brackets can give an adjacent SSN or card number the word
+        # boundary it lacked. The keyword rules can't gain a match that way (each needs
+        # its own literal prefix), so keyword-only text skips this pass.
+        text, n = pattern.subn(replacement_for, text)
         count += n
-        text = new_text
     return text, count
 
 
+# Neither NER nor Presidio reads the dependency parse. The lemmatizer (and the
+# attribute_ruler it needs) stays: Presidio's context enhancer matches context words
+# against lemmas, and scores would lose their context boost without them.
+_UNUSED_PIPES = ("parser",)
+
+
+# (analyzer, anonymizer), loaded on first use and shared across calls and threads
+_presidio_engines: tuple | None = None
+_presidio_lock = threading.Lock()
+
+
 def _load_presidio_engines():
-    """Load Presidio engines once. Fails clearly if the [private] extra is not installed."""
+    """Load Presidio engines once per process; loading the spaCy model takes seconds."""
+    global _presidio_engines
+    with _presidio_lock:
+        if _presidio_engines is None:
+            _presidio_engines = _create_presidio_engines()
+        return _presidio_engines
+
+
+def _create_presidio_engines():
+    """Fails clearly if the [private] extra is not installed."""
     try:
         from presidio_analyzer import AnalyzerEngine
         from presidio_anonymizer import AnonymizerEngine
@@ -67,89 +294,325 @@ def _load_presidio_engines():
             file=sys.stderr,
         )
         sys.exit(1)
-    return AnalyzerEngine(), AnonymizerEngine()
+    return _analyzer_engine(AnalyzerEngine), AnonymizerEngine()
 
 
-def _apply_presidio(
-    text: str, analyzer, anonymizer
-) -> tuple[str, dict[str, int], list[tuple[str, str, float]]]:
-    """Apply Presidio NLP redaction using pre-loaded engines."""
-    from presidio_anonymizer.entities import OperatorConfig
+def _analyzer_engine(analyzer_cls):
+    """Build the default analyzer, minus the spaCy pipes entity detection doesn't need.
+
+    The default NLP configuration is kept: it maps spaCy labels to Presidio entities
+    and ignores the ones Presidio has no entity for (CARDINAL, MONEY, ...).
+    """
+    analyzer = analyzer_cls()
+    try:
+        nlp = analyzer.nlp_engine.nlp["en"]
+        for name in _UNUSED_PIPES:
+            if name in nlp.pipe_names:
+                nlp.disable_pipe(name)
+    except (AttributeError, KeyError, TypeError):
+        # Older Presidio/spaCy without these hooks: keep the full pipeline
+        pass
+    return analyzer
+
+
+def _worth_analyzing(text: str) -> bool:
+    return len(text) >= _PRESIDIO_MIN_CHARS and (
+        _ENTITY_HINT_RE.search(text) is not None or text != text.lower()
+    )
+
 
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _cache_get(key: bytes) -> _PresidioResult | None:
+    result = _PRESIDIO_CACHE.get(key)
+    if result is not None:
+        _PRESIDIO_CACHE.move_to_end(key)
+    return result
+
+
+def _cache_put(key: bytes, result: _PresidioResult) -> None:
+    _PRESIDIO_CACHE[key] = result
+    if len(_PRESIDIO_CACHE) > _PRESIDIO_CACHE_SIZE:
+        _PRESIDIO_CACHE.popitem(last=False)
+
+
+def _apply_presidio(text: str, analyzer, anonymizer) -> _PresidioResult:
+    """Apply Presidio NLP redaction using pre-loaded engines."""
+    key = _cache_key(text)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     entity_types = list(_PRESIDIO_REPLACEMENTS.keys())
     results = analyzer.analyze(text=text, entities=entity_types, language="en")
+    result = _anonymize(text, results, anonymizer)
+    _cache_put(key, result)
+    return result
+
+
+def _anonymize(text: str, results: list, anonymizer) -> _PresidioResult:
+    """Replace analyzer results in text, counting entities and low-confidence hits."""
+    from presidio_anonymizer.entities import OperatorConfig
 
     if not results:
         return text, {}, []
 
-    entity_counts: dict[str, int] = {}
-    low_conf: list[tuple[str, str, float]] = []
+    entity_counts = Counter(r.entity_type for r in results)
+    replacements = {
+        etype: _PRESIDIO_REPLACEMENTS.get(etype, "[REDACTED]") for etype in entity_counts
+    }
+    low_conf = [
+        (text[r.start : r.end], replacements[r.entity_type], r.score)
+        for r in results
+        if r.score < _LOW_CONFIDENCE_THRESHOLD
+    ]
 
     # Build operators dict keyed by entity type (not per-result instance)
     operators = {
-        etype: OperatorConfig("replace", {"new_value": _PRESIDIO_REPLACEMENTS.get(etype, "[REDACTED]")})
-        for etype in {r.entity_type for r in results}
+        etype: OperatorConfig("replace", {"new_value": replacement})
+        for etype, replacement in replacements.items()
     }
 
-    for result in results:
-        entity_counts[result.entity_type] = entity_counts.get(result.entity_type, 0) + 1
-        if result.score < _LOW_CONFIDENCE_THRESHOLD:
-            snippet = text[result.start : result.end]
-            replacement = _PRESIDIO_REPLACEMENTS.get(result.entity_type, "[REDACTED]")
-            low_conf.append((snippet, replacement, result.score))
-
     anonymized = anonymizer.anonymize(text=text, analyzer_results=results, operators=operators)
     return anonymized.text, entity_counts, low_conf
 
 
-def redact_turns(
-    turns: list[Turn],
-    use_presidio: bool = True,
+def _apply_presidio_batch(
+    turn_paragraphs: list[list[str]], analyzer, anonymizer
+) -> tuple[list[list[str]], dict[str, int], list[tuple[str, str, float]]]:
+    """Apply Presidio to every turn in one batched analyzer run.
+
+    spaCy's per-call overhead dominates on short paragraphs, so each turn's paragraphs
+    are joined with _PARA_SEP and all turns go through BatchAnalyzerEngine, which
+    streams them through nlp.pipe. Paragraphs that fail _worth_analyzing are left out.
+    A turn whose text already contains the separator symbol, or whose separator an
+    entity swallowed, is analyzed paragraph by paragraph instead.
+    """
+    from presidio_analyzer import BatchAnalyzerEngine
+
+    entity_counts: Counter[str] = Counter()
+    low_conf: list[tuple[str, str, float]] = []
+
+    def _merge(counts: dict[str, int], items: list[tuple[str, str, float]]) -> None:
+        entity_counts.update(counts)
+        low_conf.extend(items)
+
+    # Indices of the paragraphs worth analyzing in each turn that has any
+    selected: dict[int, list[int]] = {}
+    # Joined text per turn; only distinct texts missing from the cache get analyzed
+    joined: dict[int, tuple[bytes, str]] = {}
+    pending: dict[bytes, str] = {}
+    for i, paras in enumerate(turn_paragraphs):
+        indices = [j for j, para in enumerate(paras) if _worth_analyzing(para)]
+        if not indices:
+            continue
+        selected[i] = indices
+        if any(_PARA_SEP_MARK in paras[j] for j in indices):
+            continue
+        text = _PARA_SEP.join([paras[j] for j in indices])
+        key = _cache_key(text)
+        joined[i] = (key, text)
+        if key not in _PRESIDIO_CACHE:
+            pending[key] = text
+
+    if pending:
+        batch = BatchAnalyzerEngine(analyzer_engine=analyzer)
+        all_results = batch.analyze_iterator(
+            list(pending.values()),
+            language="en",
+            batch_size=64,
+            entities=list(_PRESIDIO_REPLACEMENTS),
+        )
+        for (key, text), results in zip(pending.items(), all_results):
+            _cache_put(key, _anonymize(text, results, anonymizer))
+
+    # Turns Presidio finds nothing in keep their paragraph list object
+    redacted = list(turn_paragraphs)
+    for i, indices in selected.items():
+        if i in joined:
+            key, text = joined[i]
+            cached = _cache_get(key)
+            if cached is None:
+                # Evicted within this same run (more distinct turns than the cache holds)
+                cached = _apply_presidio(text, analyzer, anonymizer)
+            redacted_text, counts, items = cached
+            if not counts:
+                continue
+            parts = redacted_text.split(_PARA_SEP)
+            if len(parts) == len(indices):
+                paras = redacted[i] = list(redacted[i])
+                for j, part in zip(indices, parts):
+                    paras[j] = part
+                _merge(counts, items)
+                continue
+        for j in indices:
+            para, counts, items = _apply_presidio(redacted[i][j], analyzer, anonymizer)
+            if counts:
+                if redacted[i] is turn_paragraphs[i]:
+                    redacted[i] = list(redacted[i])
+                redacted[i][j] = para
+                _merge(counts, items)
+
+    return redacted, entity_counts, low_conf
+
+
+def _redact_one(paragraphs: list[str]) -> tuple[list[str], int]:
+    """Layer 1 over one turn's paragraphs; the list is only copied once something changes."""
+    redacted: list[str] | None = None
+    total = 0
+    for i, para in enumerate(paragraphs):
+        if len(para) > _REGEX_CACHE_MAX_CHARS:
+            para, n = _apply_regex.__wrapped__(para)
+        else:
+            para, n = _apply_regex(para)
+        if n:
+            total += n
+            if redacted is None:
+                redacted = list(paragraphs)
+            redacted[i] = para
+    return (paragraphs, 0) if redacted is None else (redacted, total)
+
+
+def _regex_layer(turns: list[Turn]) -> tuple[list[list[str]], int]:
+    """Layer 1 per paragraph."""
+    results = [_redact_one(turn.paragraphs) for turn in turns]
+    return [paragraphs for paragraphs, _ in results], sum(n for _, n in results)
+
+
+# Below this many turns a process pool costs more to start than it saves
+_PARALLEL_MIN_TURNS = 64
+
+
+def _redact_chunk(chunk: list[list[str]]) -> list[tuple[list[str] | None, int]]:
+    """Worker for _regex_layer_parallel; None marks a turn with nothing redacted."""
+    results = []
+    for paragraphs in chunk:
+        redacted, n = _redact_one(paragraphs)
+        results.append((redacted if n else None, n))
+    return results
+
+
+def _regex_layer_parallel(turns: list[Turn], parallelism: int) -> tuple[list[list[str]], int]:
+    """Layer 1 with contiguous runs of turns redacted in worker processes."""
+    # Deferred: it pulls in multiprocessing, which only the parallel path needs
+    from concurrent.futures import ProcessPoolExecutor
+
+    size = -(-len(turns) // parallelism)
+    chunks = [[turn.paragraphs for turn in turns[i : i + size]] for i in range(0, len(turns), size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        results = [result for chunk in pool.map(_redact_chunk, chunks) for result in chunk]
+    # Unchanged turns keep their own paragraph lists rather than the unpickled copies
+    turn_paragraphs = [
+        turn.paragraphs if redacted is None else redacted
+        for turn, (redacted, _) in zip(turns, results)
+    ]
+    return turn_paragraphs, sum(n for _, n in results)
+
+
+def _regex_layer_joined(turns: list[Turn]) -> tuple[list[list[str]], int]:
+    """Layer 1 over every paragraph joined with _PARA_SEP, in one regex pass.
+
+    Falls back to _regex_layer if a paragraph contains the separator symbol or a match
+    ran across a separator (e.g. a trailing "password:" taking the next paragraph).
+    """
+    paragraphs = [para for turn in turns for para in turn.paragraphs]
+    if any(_PARA_SEP_MARK in para for para in paragraphs):
+        return _regex_layer(turns)
+    # Uncached: the one-off joined buffer would only push paragraphs out of the cache
+    redacted, total = _apply_regex.__wrapped__(_PARA_SEP.join(paragraphs))
+    if not total:
+        return [turn.paragraphs for turn in turns], 0
+    parts = redacted.split(_PARA_SEP)
+    if len(parts) != len(paragraphs):
+        return _regex_layer(turns)
+
+    turn_paragraphs: list[list[str]] = []
+    pos = 0
+    for turn in turns:
+        chunk = parts[pos : pos + len(turn.paragraphs)]
+        pos += len(chunk)
+        if chunk == turn.paragraphs:
+            turn_paragraphs.append(turn.paragraphs)
+        else:
+            # Keep the original objects for the paragraphs that came back unchanged
+            turn_paragraphs.append(
+                [para if para == part else part for para, part in zip(turn.paragraphs, chunk)]
+            )
+    return turn_paragraphs, total
+
+
+def _redact(
+    turns: list[Turn], use_presidio: bool, regex_layer
 ) -> tuple[list[Turn], RedactionSummary]:
-    """Redact PII from all turns. Returns new Turn objects and a summary."""
-    total_regex = 0
-    total_entities: dict[str, int] = {}
+    all_entities: Counter[str] = Counter()
     all_low_conf: list[tuple[str, str, float]] = []
 
-    # Load Presidio engines once for the entire run (loading spaCy is expensive)
     analyzer = anonymizer = None
     if use_presidio:
         analyzer, anonymizer = _load_presidio_engines()
 
-    redacted_turns: list[Turn] = []
+    # Layer 1: regex
+    turn_paragraphs, total_regex = regex_layer(turns)
 
-    for turn in turns:
-        new_paragraphs: list[str] = []
-        for para in turn.paragraphs:
-            # Layer 1: regex
-            para, n = _apply_regex(para)
-            total_regex += n
-
-            # Layer 2: Presidio NLP
-            if use_presidio:
-                para, ent_counts, low_conf = _apply_presidio(para, analyzer, anonymizer)
-                for ent, count in ent_counts.items():
-                    total_entities[ent] = total_entities.get(ent, 0) + count
-                all_low_conf.extend(low_conf)
-
-            new_paragraphs.append(para)
-
-        redacted_turns.append(
-            Turn(
-                speaker=turn.speaker,
-                paragraphs=new_paragraphs,
-                speaker_label=turn.speaker_label,
-            )
+    # Layer 2: Presidio NLP, batched across all turns
+    if use_presidio:
+        turn_paragraphs, all_entities, all_low_conf = _apply_presidio_batch(
+            turn_paragraphs, analyzer, anonymizer
         )
 
+    redacted_turns = [
+        turn
+        if paragraphs is turn.paragraphs
+        else Turn(
+            speaker=turn.speaker,
+            paragraphs=paragraphs,
+            speaker_label=turn.speaker_label,
+        )
+        for turn, paragraphs in zip(turns, turn_paragraphs)
+    ]
+
     summary = RedactionSummary(
-        entity_counts=total_entities,
+        entity_counts=all_entities,
         low_confidence_items=all_low_conf,
         regex_count=total_regex,
     )
     return redacted_turns, summary
 
 
+def redact_turns(
+    turns: list[Turn],
+    use_presidio: bool = True,
+    parallelism: int = 1,
+) -> tuple[list[Turn], RedactionSummary]:
+    """Redact PII from all turns. Returns the turns and a summary.
+
+    Turns with nothing to redact are returned as the original objects. With
+    parallelism > 1, the regex layer of a long transcript is split across that many
+    worker processes; Presidio always runs in this process.
+    """
+    if parallelism > 1 and len(turns) >= _PARALLEL_MIN_TURNS:
+        return _redact(turns, use_presidio, partial(_regex_layer_parallel, parallelism=parallelism))
+    return _redact(turns, use_presidio, _regex_layer)
+
+
+def redact_turns_batch(
+    turns: list[Turn],
+    use_presidio: bool = True,
+) -> tuple[list[Turn], RedactionSummary]:
+    """Like redact_turns, but runs the regex layer once over all paragraphs joined.
+
+    Saves the per-paragraph call overhead on long transcripts; results are the same.
+    """
+    return _redact(turns, use_presidio, _regex_layer_joined)
+
+
+def clear_redaction_cache() -> None:
+    """Drop memoised regex and Presidio results, e.g. between jobs in a long-running process."""
+    _apply_regex.cache_clear()
+    _PRESIDIO_CACHE.clear()
+
+
 def print_privacy_warning(summary: RedactionSummary) -> None:
     """Print the --private mode warning to stderr."""
     total_nlp = sum(summary.entity_counts.values())
@@ -168,6 +631,8 @@ def print_privacy_warning(summary: RedactionSummary) -> None:
         f"   Low-confidence items: {len(summary.low_confidence_items)}"
         + (" — manual review recommended" if summary.low_confidence_items else "")
         + "\n"
+        f"   NLP detection skips paragraphs under {_PRESIDIO_MIN_CHARS} characters\n"
+        "   or with no capital letter, digit or '@'.\n"
         "   This tool makes a good-faith effort but cannot guarantee completeness.\n"
         "   Always review output before sharing.\n",
         file=sys.stderr,
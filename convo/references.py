@@ -3,19 +3,36 @@
 from __future__ import annotations
 
 import json
-import re
+import os
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
+from pathlib import Path
 
 from convo.parser import Turn
+from convo.regex import load_engine
 
-# Match YouTube URLs in various forms
-_YT_RE = re.compile(
+_re_engine = load_engine()
+
+# Match YouTube URLs in various forms. Video ids are ASCII, so RE2's ASCII-only \w
+# loses nothing.
+_YT_RE = _re_engine.compile(
     r"https?://(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)([\w-]{11})"
 )
 
+# Concurrent yt-dlp lookups in collect_references
+_RESOLVE_WORKERS = 8
+
+# Resolved metadata keyed by video id, so watch?v= and youtu.be/ forms share entries.
+# Read at call time; None means $XDG_CACHE_HOME/convo/yt.json (~/.cache by default).
+_CACHE_PATH: Path | None = None
+_CACHE_TTL = 30 * 24 * 3600  # seconds; titles and channels do change
+_cache: dict[str, dict] | None = None
+_cache_lock = threading.Lock()
+
 
-@dataclass
+@dataclass(slots=True)
 class Reference:
     url: str
     title: str
@@ -40,6 +57,9 @@ def extract_youtube_urls(turns: list[Turn]) -> list[str]:
     urls: list[str] = []
     for turn in turns:
         for para in turn.paragraphs:
+            # Substring check covers youtube.com and youtu.be; skips the regex for most text
+            if "youtu" not in para:
+                continue
             for match in _YT_RE.finditer(para):
                 video_id = match.group(1)
                 if video_id not in seen:
@@ -48,25 +68,159 @@ def extract_youtube_urls(turns: list[Turn]) -> list[str]:
     return urls
 
 
-def resolve_youtube(url: str) -> Reference:
-    """Resolve YouTube URL metadata via yt-dlp --dump-json."""
+class _SilentLogger:
+    """Swallow yt-dlp's console output; failures surface as the URL-as-title fallback."""
+
+    def debug(self, msg: str) -> None:
+        pass
+
+    info = warning = error = debug
+
+
+_local = threading.local()
+
+
+def _youtube_dl():
+    """Per-thread yt_dlp.YoutubeDL, or None if the yt_dlp package isn't importable."""
+    ydl = getattr(_local, "ydl", None)
+    if ydl is None:
+        try:
+            import yt_dlp
+        except ImportError:
+            return None
+        ydl = _local.ydl = yt_dlp.YoutubeDL({
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+            "socket_timeout": 15,
+            "logger": _SilentLogger(),
+        })
+    return ydl
+
+
+def _fetch_metadata(url: str) -> dict | None:
+    """Fetch video metadata in-process via yt_dlp, else through the yt-dlp CLI."""
+    ydl = _youtube_dl()
+    if ydl is not None:
+        from yt_dlp.utils import DownloadError
+
+        try:
+            return ydl.extract_info(url, download=False)
+        except DownloadError:
+            return None
+
+    # Deferred to the only path that needs it. orjson parses yt-dlp's --dump-json
+    # bytes directly; stdlib json also accepts bytes.
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
     try:
         result = subprocess.run(
             ["yt-dlp", "--dump-json", "--no-download", url],
             capture_output=True,
-            text=True,
             timeout=15,
         )
         if result.returncode == 0:
-            data = json.loads(result.stdout)
-            return Reference(
+            return json_loads(result.stdout)
+    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
+        pass
+    return None
+
+
+def _video_id(url: str) -> str | None:
+    m = _YT_RE.search(url)
+    return m.group(1) if m else None
+
+
+def _cache_path() -> Path:
+    if _CACHE_PATH is not None:
+        return _CACHE_PATH
+    # The XDG spec says to ignore a relative XDG_CACHE_HOME
+    xdg = os.environ.get("XDG_CACHE_HOME", "")
+    base = Path(xdg) if os.path.isabs(xdg) else Path.home() / ".cache"
+    return base / "convo" / "yt.json"
+
+
+def _load_cache() -> dict[str, dict]:
+    """Load the on-disk metadata cache on first use. Caller holds _cache_lock."""
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(_cache_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _cache = {}
+        if not isinstance(_cache, dict):
+            _cache = {}
+    return _cache
+
+
+def _save_cache(cache: dict[str, dict]) -> None:
+    """Write the cache atomically; a failed write only costs a re-fetch later."""
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _cached_reference(url: str, entry: object) -> Reference | None:
+    """Reference from a fresh cache entry; a stale or malformed one is a miss."""
+    if not isinstance(entry, dict):
+        return None
+    fetched = entry.get("fetched")
+    if isinstance(fetched, bool) or not isinstance(fetched, (int, float)):
+        return None
+    if not time.time() - fetched < _CACHE_TTL:  # also rejects a NaN timestamp
+        return None
+    title = entry.get("title", url)
+    channel = entry.get("channel")
+    duration = entry.get("duration")
+    if not isinstance(title, str) or not all(
+        value is None or isinstance(value, str) for value in (channel, duration)
+    ):
+        return None
+    return Reference(url=url, title=title, channel=channel, duration=duration)
+
+
+def resolve_youtube(url: str) -> Reference:
+    """Resolve YouTube URL metadata via yt-dlp, reusing cached results for 30 days."""
+    vid = _video_id(url)
+    if vid:
+        with _cache_lock:
+            entry = _load_cache().get(vid)
+        ref = _cached_reference(url, entry)
+        if ref is not None:
+            return ref
+
+    data = _fetch_metadata(url)
+    if data:
+        try:
+            ref = Reference(
                 url=url,
                 title=data.get("title", url),
                 channel=data.get("channel") or data.get("uploader"),
                 duration=_format_duration(data["duration"]) if data.get("duration") else None,
             )
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError, KeyError):
-        pass
+        except (KeyError, TypeError, ValueError):
+            pass
+        else:
+            # Only successful lookups are cached, so transient failures get retried
+            if vid:
+                with _cache_lock:
+                    cache = _load_cache()
+                    cache[vid] = {
+                        "title": ref.title,
+                        "channel": ref.channel,
+                        "duration": ref.duration,
+                        "fetched": time.time(),
+                    }
+                    _save_cache(cache)
+            return ref
     # Fallback: return URL as-is
     return Reference(url=url, title=url)
 
@@ -78,23 +232,23 @@ def collect_references(
     """Collect and deduplicate references from conversation + CLI args.
 
     CLI refs are resolved first (marked source="cli"), then auto-detected
-    conversation URLs are added if not already present.
+    conversation URLs are added if not already present. YouTube lookups run
+    concurrently; the returned order is unaffected.
     """
-    refs: list[Reference] = []
+    refs: list[Reference | None] = []
+    pending: list[tuple[int, str, str]] = []  # (slot in refs, url, source)
     seen_ids: set[str] = set()
 
-    def _video_id(url: str) -> str | None:
-        m = _YT_RE.search(url)
-        return m.group(1) if m else None
+    def _queue(url: str, source: str) -> None:
+        pending.append((len(refs), url, source))
+        refs.append(None)
 
     # CLI-provided refs first
     for url in cli_refs or []:
         vid = _video_id(url)
         if vid and vid not in seen_ids:
             seen_ids.add(vid)
-            ref = resolve_youtube(url)
-            ref.source = "cli"
-            refs.append(ref)
+            _queue(url, "cli")
         elif not vid:
             # Non-YouTube URL, just add as-is
             refs.append(Reference(url=url, title=url, source="cli"))
@@ -104,8 +258,16 @@ def collect_references(
         vid = _video_id(url)
         if vid and vid not in seen_ids:
             seen_ids.add(vid)
-            ref = resolve_youtube(url)
-            ref.source = "conversation"
-            refs.append(ref)
+            _queue(url, "conversation")
+
+    # Each lookup is a network-bound yt-dlp call, so overlap them
+    if pending:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(_RESOLVE_WORKERS, len(pending))) as pool:
+            resolved = pool.map(resolve_youtube, [url for _, url, _ in pending])
+            for (slot, _, source), ref in zip(pending, resolved):
+                ref.source = source
+                refs[slot] = ref
 
-    return refs
+    return [ref for ref in refs if ref is not None]
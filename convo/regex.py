@@ -0,0 +1,21 @@
+"""Regex engine selection shared by redaction and URL scanning."""
+
+from __future__ import annotations
+
+import os
+import re
+
+
+def load_engine():
+    """RE2 (google-re2) when installed, else the stdlib re module.
+
+    RE2 matches in linear time, but its \\d, \\s, \\w and \\b are ASCII-only.
+    CONVO_RE2=0 forces the stdlib engine even when RE2 is installed.
+    """
+    if os.environ.get("CONVO_RE2", "1") == "0":
+        return re
+    try:
+        import re2
+    except ImportError:
+        return re
+    return re2
@@ -9,6 +9,13 @@ from convo.themes import Theme
 
 _TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
+_ENV = Environment(
+    loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+    autoescape=True,
+    auto_reload=False,
+)
+_TEMPLATE = _ENV.get_template("conversation.html.j2")
+
 
 def render_html(
     turns: list[Turn],
@@ -22,13 +29,7 @@ def render_html(
     references: list | None = None,
 ) -> None:
     """Render turns to a self-contained HTML file."""
-    env = Environment(
-        loader=FileSystemLoader(str(_TEMPLATES_DIR)),
-        autoescape=True,
-    )
-    template = env.get_template("conversation.html.j2")
-
-    html_content = template.render(
+    stream = _TEMPLATE.stream(
         turns=turns,
         theme=theme,
         mobile=mobile,
@@ -39,4 +40,6 @@ def render_html(
         references=references,
     )
 
-    output_path.write_text(html_content, encoding="utf-8")
+    # Write template output as it's generated rather than building the whole page in memory
+    with output_path.open("w", encoding="utf-8") as f:
+        stream.dump(f)
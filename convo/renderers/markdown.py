@@ -2,10 +2,30 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from convo.parser import Turn
-from convo.references import Reference
+
+if TYPE_CHECKING:
+    from convo.references import Reference
+
+_WRITE_BUFFER = 1024 * 1024
+
+
+_TURN_HEADING = "\n\n**{marker} {label}**\n\n"
+
+
+@lru_cache(maxsize=64)
+def _heading(speaker: str, label: str) -> str:
+    """Blank-line separator plus bold speaker line, built once per distinct speaker."""
+    return _TURN_HEADING.format(marker="●" if speaker == "assistant" else "❯", label=label)
+
+
+def _format_turn(turn: Turn) -> str:
+    """Format one turn as a Markdown block, led by its blank-line separator."""
+    return _heading(turn.speaker, turn.speaker_label) + "\n\n".join([*turn.paragraphs, "---"])
 
 
 def render_markdown(
@@ -16,46 +36,34 @@ def render_markdown(
     references: list[Reference] | None = None,
 ) -> None:
     """Render turns to a Markdown file suitable for Obsidian."""
-    lines: list[str] = []
-
-    asst_name = next((t.speaker_label for t in turns if t.speaker == "assistant"), "Assistant")
-    user_name = next((t.speaker_label for t in turns if t.speaker == "user"), "User")
-
-    lines.append(f"# {title}")
-    lines.append("")
-    lines.append(f"*{date} · {asst_name} & {user_name}*")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    for turn in turns:
-        if turn.speaker == "assistant":
-            lines.append(f"**● {turn.speaker_label}**")
-        else:
-            lines.append(f"**❯ {turn.speaker_label}**")
-        lines.append("")
-
-        for para in turn.paragraphs:
-            lines.append(para)
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-    if references:
-        lines.append("## References")
-        lines.append("")
-        for ref in references:
-            safe_title = ref.title.replace("[", "\\[").replace("]", "\\]")
-            parts = [f"- [{safe_title}]({ref.url})"]
-            meta = []
-            if ref.channel:
-                meta.append(ref.channel)
-            if ref.duration:
-                meta.append(ref.duration)
-            if meta:
-                parts.append(f"  *{' · '.join(meta)}*")
-            lines.append("\n".join(parts))
-        lines.append("")
-
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    # One walk for both names, stopping once each speaker has been seen
+    asst_name: str | None = None
+    user_name: str | None = None
+    for t in turns:
+        if asst_name is None and t.speaker == "assistant":
+            asst_name = t.speaker_label
+        elif user_name is None and t.speaker == "user":
+            user_name = t.speaker_label
+        if asst_name is not None and user_name is not None:
+            break
+    if asst_name is None:
+        asst_name = "Assistant"
+    if user_name is None:
+        user_name = "User"
+
+    # Blocks are separated by one blank line and written as they're produced
+    with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+        write = f.write
+        write(f"# {title}\n\n*{date} · {asst_name} & {user_name}*\n\n---")
+        f.writelines(map(_format_turn, turns))
+
+        if references:
+            write("\n\n## References\n")
+            for ref in references:
+                safe_title = ref.title.replace("[", "\\[").replace("]", "\\]")
+                meta = " · ".join(m for m in (ref.channel, ref.duration) if m)
+                write(f"\n- [{safe_title}]({ref.url})")
+                if meta:
+                    write(f"\n  *{meta}*")
+
+        write("\n")
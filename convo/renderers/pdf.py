@@ -1,13 +1,14 @@
 """PDF renderer using ReportLab."""
 
 import html
+from collections.abc import Iterator
 from pathlib import Path
 
 from reportlab.lib.colors import HexColor
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm
-from reportlab.platypus import HRFlowable, Paragraph, SimpleDocTemplate, Spacer
+from reportlab.platypus import Flowable, HRFlowable, Paragraph, SimpleDocTemplate, Spacer
 
 from convo.parser import Turn
 from convo.themes import Theme
@@ -92,101 +93,115 @@ def _make_styles(theme: Theme, mobile: bool) -> dict[str, ParagraphStyle]:
     }
 
 
-def render_pdf(
+def _story(
     turns: list[Turn],
-    output_path: Path,
     theme: Theme,
-    mobile: bool,
+    styles: dict[str, ParagraphStyle],
     title: str,
     date: str,
     assistant_label: str,
     user_label: str,
-    references: list | None = None,
-) -> None:
-    """Render turns to a styled PDF file."""
-    pagesize = MOBILE_SIZE if mobile else A4
-    margin = 12 * mm if mobile else 20 * mm
-
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=pagesize,
-        leftMargin=margin,
-        rightMargin=margin,
-        topMargin=margin,
-        bottomMargin=margin,
-    )
-
-    styles = _make_styles(theme, mobile)
-    bg_draw = _bg_callback(theme.page_bg)
+    references: list | None,
+) -> Iterator[Flowable]:
+    """Yield the document's flowables in reading order."""
     hr_color = _hex(theme.hr_color)
     dim_color = _hex_dim(theme.hr_color)
 
-    story = []
-
     # ── Title block ──────────────────────────────────────────────────────────
-    story.append(Paragraph(html.escape(title), styles["title"]))
-    story.append(Paragraph("A Conversation", styles["subtitle"]))
-    story.append(
-        Paragraph(
-            f"{html.escape(assistant_label)} &amp; {html.escape(user_label)} · {html.escape(date)}",
-            styles["meta"],
-        )
+    yield Paragraph(html.escape(title), styles["title"])
+    yield Paragraph("A Conversation", styles["subtitle"])
+    yield Paragraph(
+        f"{html.escape(assistant_label)} &amp; {html.escape(user_label)} · {html.escape(date)}",
+        styles["meta"],
     )
-    story.append(HRFlowable(width="100%", thickness=1, color=hr_color, spaceAfter=12))
+    yield HRFlowable(width="100%", thickness=1, color=hr_color, spaceAfter=12)
 
     # ── Conversation turns ────────────────────────────────────────────────────
+    escape = html.escape
+    speaker_styles = {
+        "assistant": ("●", styles["asst_label"], styles["asst_body"]),
+        "user": ("»", styles["user_label"], styles["user_body"]),
+    }
+    # Labels repeat on every turn; escape each distinct one once
+    label_texts: dict[tuple[str, str], str] = {}
+
+    last = len(turns) - 1
     for i, turn in enumerate(turns):
-        if turn.speaker == "assistant":
-            label_style = styles["asst_label"]
-            body_style = styles["asst_body"]
-            label_text = f"● {html.escape(turn.speaker_label)}"
-        else:
-            label_style = styles["user_label"]
-            body_style = styles["user_body"]
-            label_text = f"» {html.escape(turn.speaker_label)}"
+        marker, label_style, body_style = speaker_styles.get(turn.speaker, speaker_styles["user"])
+        key = (marker, turn.speaker_label)
+        label_text = label_texts.get(key)
+        if label_text is None:
+            label_text = label_texts[key] = f"{marker} {escape(turn.speaker_label)}"
 
-        story.append(Paragraph(label_text, label_style))
+        yield Paragraph(label_text, label_style)
 
         for para in turn.paragraphs:
             if para == "---":
-                story.append(
-                    HRFlowable(
-                        width="80%",
-                        thickness=0.5,
-                        color=dim_color,
-                        spaceAfter=4,
-                        spaceBefore=4,
-                        hAlign="LEFT",
-                    )
+                yield HRFlowable(
+                    width="80%",
+                    thickness=0.5,
+                    color=dim_color,
+                    spaceAfter=4,
+                    spaceBefore=4,
+                    hAlign="LEFT",
                 )
             else:
-                story.append(Paragraph(html.escape(para), body_style))
+                yield Paragraph(escape(para), body_style)
 
         # Thin divider between turns (skip after last)
-        if i < len(turns) - 1:
-            story.append(Spacer(1, 4))
-            story.append(
-                HRFlowable(width="100%", thickness=0.5, color=dim_color, spaceAfter=2)
-            )
+        if i < last:
+            yield Spacer(1, 4)
+            yield HRFlowable(width="100%", thickness=0.5, color=dim_color, spaceAfter=2)
 
     # ── References section ──────────────────────────────────────────────────
     if references:
-        story.append(Spacer(1, 16))
-        story.append(HRFlowable(width="100%", thickness=1, color=hr_color, spaceAfter=12))
-        story.append(Paragraph("References", styles["title"].clone(
+        yield Spacer(1, 16)
+        yield HRFlowable(width="100%", thickness=1, color=hr_color, spaceAfter=12)
+        yield Paragraph("References", styles["title"].clone(
             "CFRefTitle", fontSize=14, leading=18, spaceAfter=8,
-        )))
+        ))
         ref_style = _body_style("CFRef", theme.assistant_text, theme.font_body, 9, 13)
         ref_meta_style = _body_style("CFRefMeta", theme.subtitle_color, theme.font_body, 8, 11)
         for ref in references:
-            story.append(Paragraph(html.escape(ref.title), ref_style))
+            yield Paragraph(html.escape(ref.title), ref_style)
             meta_parts = []
             if ref.channel:
                 meta_parts.append(ref.channel)
             if ref.duration:
                 meta_parts.append(ref.duration)
             meta_parts.append(ref.url)
-            story.append(Paragraph(html.escape(" · ".join(meta_parts)), ref_meta_style))
-            story.append(Spacer(1, 6))
+            yield Paragraph(html.escape(" · ".join(meta_parts)), ref_meta_style)
+            yield Spacer(1, 6)
+
+
+def render_pdf(
+    turns: list[Turn],
+    output_path: Path,
+    theme: Theme,
+    mobile: bool,
+    title: str,
+    date: str,
+    assistant_label: str,
+    user_label: str,
+    references: list | None = None,
+) -> None:
+    """Render turns to a styled PDF file."""
+    pagesize = MOBILE_SIZE if mobile else A4
+    margin = 12 * mm if mobile else 20 * mm
+
+    doc = SimpleDocTemplate(
+        str(output_path),
+        pagesize=pagesize,
+        leftMargin=margin,
+        rightMargin=margin,
+        topMargin=margin,
+        bottomMargin=margin,
+    )
+
+    styles = _make_styles(theme, mobile)
+    bg_draw = _bg_callback(theme.page_bg)
 
+    # Platypus consumes the story from the front and re-inserts split remainders,
+    # so it needs a real list; consumed flowables are released as pages are laid out
+    story = list(_story(turns, theme, styles, title, date, assistant_label, user_label, references))
     doc.build(story, onFirstPage=bg_draw, onLaterPages=bg_draw)
@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from convo.parser import Turn
-from convo.references import Reference
+
+if TYPE_CHECKING:
+    from convo.references import Reference
+
+_WRITE_BUFFER = 1024 * 1024
+
+
+_TURN_HEADING = "\n[{label}]\n"
+
+
+@lru_cache(maxsize=64)
+def _heading(label: str) -> str:
+    """Blank-line separator plus bracketed speaker line, built once per distinct label."""
+    return _TURN_HEADING.format(label=label.upper())
+
+
+def _format_turn(turn: Turn) -> str:
+    """Format one turn as a text block, led by its blank-line separator."""
+    body = "".join(["\n" if para == "---" else para + "\n\n" for para in turn.paragraphs])
+    return _heading(turn.speaker_label) + body + "---\n"
 
 
 def render_text(
@@ -16,35 +37,20 @@ def render_text(
     references: list[Reference] | None = None,
 ) -> None:
     """Render turns to a plain text file."""
-    lines: list[str] = []
-
-    lines.append(f"=== {title} ===")
-    lines.append(date)
-    lines.append("")
-
-    for turn in turns:
-        prefix = f"[{turn.speaker_label.upper()}]"
-        lines.append(prefix)
-        for para in turn.paragraphs:
-            if para == "---":
-                lines.append("")
-            else:
-                lines.append(para)
-                lines.append("")
-        lines.append("---")
-        lines.append("")
-
-    if references:
-        lines.append("=== References ===")
-        lines.append("")
-        for ref in references:
-            parts = [ref.title]
-            if ref.channel:
-                parts.append(f"Channel: {ref.channel}")
-            if ref.duration:
-                parts.append(f"Duration: {ref.duration}")
-            parts.append(ref.url)
-            lines.append("  ".join(parts))
-            lines.append("")
-
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    # Written straight to a buffered file; each blank separator line is emitted
+    # before the block that follows it, so the file doesn't end with a blank line
+    with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+        write = f.write
+        write(f"=== {title} ===\n{date}\n")
+        f.writelines(map(_format_turn, turns))
+
+        if references:
+            write("\n=== References ===\n")
+            for ref in references:
+                parts = [ref.title]
+                if ref.channel:
+                    parts.append(f"Channel: {ref.channel}")
+                if ref.duration:
+                    parts.append(f"Duration: {ref.duration}")
+                parts.append(ref.url)
+                write("\n" + "  ".join(parts) + "\n")
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import io
 import json
 import subprocess
+import threading
 
 from convo.parser import Turn
 
 _DEFAULT_MODEL = "gemma3:27b"
 
+# Seconds before a stalled model is killed; Popen has no read timeout
+_TIMEOUT = 30
+
 _PROMPT = """You are a title generator. Given the opening of a conversation, produce a short,
 descriptive title (3-8 words). The title should capture the main topic or theme,
 not be generic. Do not use quotes. Do not explain. Just output the title.
@@ -21,19 +26,19 @@ Title:"""
 
 def _turns_to_text(turns: list[Turn], max_chars: int = 3000) -> str:
     """Convert turns to plain text, truncated to max_chars."""
-    lines: list[str] = []
-    total = 0
+    buf = io.StringIO()
+    write = buf.write
     for turn in turns:
-        label = turn.speaker_label
+        prefix = turn.speaker_label + ": "
         for para in turn.paragraphs:
             if para == "---":
                 continue
-            line = f"{label}: {para}"
-            if total + len(line) > max_chars:
-                return "\n".join(lines)
-            lines.append(line)
-            total += len(line)
-    return "\n".join(lines)
+            write(prefix)
+            write(para)
+            write("\n")
+            if buf.tell() >= max_chars:
+                return buf.getvalue()[:max_chars].rstrip("\n")
+    return buf.getvalue().rstrip("\n")
 
 
 def generate_title(
@@ -51,25 +56,39 @@ def generate_title(
     prompt = _PROMPT.format(conversation=conversation)
 
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             [
                 "ollama", "run", model,
                 "--nowordwrap",
                 prompt,
             ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=30,
-        )
-        if result.returncode == 0:
-            title = result.stdout.strip()
-            # Clean up: remove quotes, trailing periods, extra whitespace
-            title = title.strip('"\'').strip(".").strip()
-            # Take only the first line if model got chatty
-            title = title.split("\n")[0].strip()
-            if title:
-                return title
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-
-    return None
+        ) as proc:
+            timed_out = threading.Event()
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(_TIMEOUT, _kill)
+            timer.start()
+            try:
+                # Only the first line is used, so stop the model instead of waiting
+                # for it to finish if it got chatty
+                first_line = next((line for line in proc.stdout if line.strip()), "")
+                exit_code = proc.poll()
+            finally:
+                timer.cancel()
+                proc.terminate()
+    except FileNotFoundError:
+        return None
+
+    # A killed or failed run, or a line cut off before its newline, gives no title
+    if timed_out.is_set() or exit_code or not first_line.endswith("\n"):
+        return None
+
+    # Clean up: remove quotes, trailing periods, extra whitespace
+    title = first_line.strip().strip('"\'').strip(".").strip()
+    return title or None
@@ -4,7 +4,16 @@ from pathlib import Path
 
 import pytest
 
-from convo.parser import Turn, _classify, _paragraphize, detect_date, detect_title, parse
+from convo.parser import (
+    Turn,
+    _classify,
+    _paragraphize,
+    _read_head,
+    detect_date,
+    detect_title,
+    parse,
+    scan_head,
+)
 from convo.parser import LineType
 
 FIXTURE = Path(__file__).parent / "fixtures" / "sample_conversation.txt"
@@ -158,6 +167,31 @@ class TestParse:
         all_paras = [p for t in asst_turns for p in t.paragraphs]
         assert "---" in all_paras
 
+    def test_strips_only_leading_marker(self, tmp_path):
+        f = tmp_path / "convo.txt"
+        f.write_text("❯ ● quoted marker\n")
+        assert parse(f)[0].paragraphs == ["● quoted marker"]
+
+    def test_unicode_line_separators(self, tmp_path):
+        f = tmp_path / "convo.txt"
+        f.write_text("❯ question ● answer\x0c\x85more\n", encoding="utf-8")
+        for turns in (parse(f), parse(f, text=f.read_text(encoding="utf-8"))):
+            assert [(t.speaker, t.paragraphs) for t in turns] == [
+                ("user", ["question"]),
+                ("assistant", ["answer", "more"]),
+            ]
+
+    def test_head_unicode_line_separators(self, tmp_path):
+        f = tmp_path / "convo.txt"
+        f.write_text("hello\x0c# Title\n❯ Hello\n", encoding="utf-8")
+        assert detect_title(f, []) == "Title"
+        f.write_text("\u2028".join(["filler"] * 29 + ["# Spaced Title 2026-01-15"]), encoding="utf-8")
+        assert scan_head(_read_head(f)) == ("Spaced Title 2026-01-15", "2026-01-15")
+
+    def test_text_matches_file(self):
+        text = FIXTURE.read_text(encoding="utf-8")
+        assert parse(FIXTURE, text=text) == parse(FIXTURE)
+
     def test_empty_file(self, tmp_path):
         empty = tmp_path / "empty.txt"
         empty.write_text("")
@@ -172,6 +206,16 @@ class TestAutoDetect:
         # Fixture filename is "sample_conversation" → "Sample Conversation"
         assert title == "Sample Conversation"
 
+    def test_detect_title_from_heading(self, tmp_path):
+        f = tmp_path / "convo.txt"
+        f.write_text("# Session Notes\n❯ Hello\n")
+        assert detect_title(f, []) == "Session Notes"
+
+    def test_detect_title_only_scans_head(self, tmp_path):
+        f = tmp_path / "late_heading.txt"
+        f.write_text("filler\n" * 30 + "# Too Late\n")
+        assert detect_title(f, []) == "Late Heading"
+
     def test_detect_date_fallback_to_mtime(self):
         date = detect_date(FIXTURE)
         # Should return a YYYY-MM-DD string
@@ -182,3 +226,20 @@ class TestAutoDetect:
         f = tmp_path / "convo.txt"
         f.write_text("❯ Hello\n● This was on 2026-01-15 when things happened.\n")
         assert detect_date(f) == "2026-01-15"
+
+    def test_detect_date_written(self, tmp_path):
+        f = tmp_path / "convo.txt"
+        f.write_text("❯ Hello\n● We met on March 3, 2025 to talk.\n")
+        assert detect_date(f) == "March 3, 2025"
+
+    def test_detect_date_prefers_iso(self, tmp_path):
+        f = tmp_path / "convo.txt"
+        f.write_text("❯ Since March 3, 2025\n● Logged 2026-01-15.\n")
+        assert detect_date(f) == "2026-01-15"
+
+    def test_scan_head_finds_both(self):
+        head = ["# Session Notes", "Started March 3, 2025", "Logged 2026-01-15"]
+        assert scan_head(head) == ("Session Notes", "2026-01-15")
+
+    def test_scan_head_empty(self):
+        assert scan_head(["❯ Hello", "● Hi"]) == (None, None)
@@ -1,7 +1,23 @@
 """Tests for the privacy / PII redaction module."""
 
+import re
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from convo import privacy
 from convo.parser import Turn
-from convo.privacy import _apply_regex, redact_turns
+from convo.privacy import (
+    _PARA_SEP,
+    _PARA_SEP_MARK,
+    _analyzer_engine,
+    _apply_regex,
+    _worth_analyzing,
+    clear_redaction_cache,
+    redact_turns,
+    redact_turns_batch,
+)
 
 
 def _turn(text: str, speaker: str = "assistant") -> Turn:
@@ -52,6 +68,199 @@ class TestRegexRedaction:
         assert count == 2
         assert result.count("[REDACTED_KEY]") == 2
 
+    def test_redacts_matches_exposed_by_adjacent_redaction(self):
+        text = "Card: 4111 1111 1111 1111password=hunter2"
+        result, count = _apply_regex(text)
+        assert result == "Card: [REDACTED_CARD][REDACTED_PASSWORD]"
+        assert count == 2
+
+    def test_password_value_with_bearer_token(self):
+        assert _apply_regex("password: Bearer tok123") == ("[REDACTED_PASSWORD]", 1)
+        assert _apply_regex("password==Bearer tok123 ok") == ("[REDACTED_PASSWORD] ok", 1)
+
+    def test_key_ends_bearer_token(self):
+        text = "Bearer x.sk-abc123def456ghi789jkl0.Bearer secret"
+        result, count = _apply_regex(text)
+        assert result == "[REDACTED_KEY][REDACTED_KEY].[REDACTED_KEY]"
+        assert count == 3
+
+    def test_redacts_unicode_separators_and_digits(self):
+        assert _apply_regex("Card 4111\u00a01111\u202f1111\u00a01111") == (
+            "Card [REDACTED_CARD]",
+            1,
+        )
+        assert _apply_regex("SSN １２３-４５-６７８９") == ("SSN [REDACTED_SSN]", 1)
+
+    def test_redacts_across_ascii_control_whitespace(self):
+        assert _apply_regex("Card 4111\x1c1111\x1c1111\x1c1111") == ("Card [REDACTED_CARD]", 1)
+        assert _apply_regex("password\x0b=\x1chunter2") == ("[REDACTED_PASSWORD]", 1)
+
+    def test_clear_redaction_cache(self):
+        _apply_regex("SSN is 123-45-6789")
+        assert _apply_regex.cache_info().currsize > 0
+        clear_redaction_cache()
+        assert _apply_regex.cache_info().currsize == 0
+        assert _apply_regex("SSN is 123-45-6789") == ("SSN is [REDACTED_SSN]", 1)
+
+
+# ── Presidio screen ───────────────────────────────────────────────────────────
+
+class TestPresidioScreen:
+    def test_skips_text_without_entity_hints(self):
+        assert not _worth_analyzing("---")
+        assert not _worth_analyzing("ok")
+        assert not _worth_analyzing("sounds good, thanks for the help")
+
+    def test_keeps_capitals_digits_and_emails(self):
+        assert _worth_analyzing("Thanks, Alice")
+        assert _worth_analyzing("call me on 555 0100")
+        assert _worth_analyzing("mail bob@example.com")
+
+    def test_length_floor(self):
+        assert not _worth_analyzing("Al")
+        assert _worth_analyzing("Ali")
+        assert _worth_analyzing("Thanks, Alice")
+
+
+class _StubNlp:
+    def __init__(self):
+        self.pipe_names = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+        self.disabled = []
+
+    def disable_pipe(self, name):
+        self.disabled.append(name)
+
+
+class _StubAnalyzerEngine:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.nlp_engine = SimpleNamespace(nlp={"en": _StubNlp()})
+
+
+class TestAnalyzerEngine:
+    def test_keeps_default_nlp_configuration(self):
+        analyzer = _analyzer_engine(_StubAnalyzerEngine)
+        # No custom NLP engine, so Presidio's default entity mapping and labels_to_ignore
+        # (CARDINAL, MONEY, ORDINAL, ...) still apply
+        assert analyzer.kwargs == {}
+        assert analyzer.nlp_engine.nlp["en"].disabled == ["parser"]
+
+    def test_keeps_full_pipeline_without_hooks(self):
+        analyzer = _analyzer_engine(SimpleNamespace)
+        assert not hasattr(analyzer, "nlp_engine")
+
+
+# ── Presidio layer (stand-in engines) ─────────────────────────────────────────
+
+class _StandInResult:
+    def __init__(self, entity_type, start, end, score):
+        self.entity_type, self.start, self.end, self.score = entity_type, start, end, score
+
+
+class _StandInAnalyzer:
+    """Finds "Alice" and "Bob" as people; "Dr." plus whatever follows it reaches past
+    the end of a paragraph, as a real entity can swallow a joining separator."""
+
+    _PATTERN = re.compile(r"Alice|Bob|Dr\.\s+\S+")
+
+    def __init__(self):
+        self.texts = []
+
+    def analyze(self, text, entities, language):
+        self.texts.append(text)
+        return [
+            _StandInResult("PERSON", m.start(), m.end(), 0.5 if m.group() == "Bob" else 0.9)
+            for m in self._PATTERN.finditer(text)
+        ]
+
+
+class _StandInAnonymizer:
+    def anonymize(self, text, analyzer_results, operators):
+        for r in sorted(analyzer_results, key=lambda r: r.start, reverse=True):
+            text = text[: r.start] + operators[r.entity_type].params["new_value"] + text[r.end :]
+        return SimpleNamespace(text=text)
+
+
+class _StandInBatchAnalyzerEngine:
+    def __init__(self, analyzer_engine):
+        self.analyzer = analyzer_engine
+
+    def analyze_iterator(self, texts, language, batch_size, entities):
+        return [self.analyzer.analyze(text, entities, language) for text in texts]
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Stand-in Presidio modules and engines; the analyzer records every text it sees."""
+    analyzer = _StandInAnalyzer()
+    monkeypatch.setitem(
+        sys.modules,
+        "presidio_analyzer",
+        SimpleNamespace(BatchAnalyzerEngine=_StandInBatchAnalyzerEngine),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "presidio_anonymizer.entities",
+        SimpleNamespace(OperatorConfig=lambda name, params: SimpleNamespace(params=params)),
+    )
+    monkeypatch.setattr(privacy, "_presidio_engines", (analyzer, _StandInAnonymizer()))
+    clear_redaction_cache()
+    yield analyzer
+    clear_redaction_cache()
+
+
+def _paragraphs_turn(*paragraphs: str) -> Turn:
+    return Turn(speaker="user", paragraphs=list(paragraphs), speaker_label="User")
+
+
+class TestPresidioLayer:
+    def test_joined_turn_splits_back(self, analyzer):
+        redacted, summary = redact_turns([_paragraphs_turn("Hi Alice", "ok", "Bob said")])
+        assert redacted[0].paragraphs == ["Hi [NAME]", "ok", "[NAME] said"]
+        # One analyzer call for the turn; "ok" has nothing NER could find
+        assert analyzer.texts == [f"Hi Alice{_PARA_SEP}Bob said"]
+        assert summary.entity_counts == {"PERSON": 2}
+        assert summary.low_confidence_items == [("Bob", "[NAME]", 0.5)]
+
+    def test_swallowed_separator_falls_back(self, analyzer):
+        redacted, summary = redact_turns([_paragraphs_turn("ask Dr.", "Bob is in")])
+        assert redacted[0].paragraphs == ["ask Dr.", "[NAME] is in"]
+        assert analyzer.texts[1:] == ["ask Dr.", "Bob is in"]
+        assert summary.entity_counts == {"PERSON": 1}
+
+    def test_separator_symbol_in_text_falls_back(self, analyzer):
+        redacted, _ = redact_turns([_paragraphs_turn(f"x {_PARA_SEP_MARK} Alice", "Bob")])
+        assert redacted[0].paragraphs == [f"x {_PARA_SEP_MARK} [NAME]", "[NAME]"]
+        assert analyzer.texts == [f"x {_PARA_SEP_MARK} Alice", "Bob"]
+
+    def test_repeated_turns_analyzed_once(self, analyzer):
+        turns = [_paragraphs_turn("Hi Alice")] * 5
+        redacted, summary = redact_turns(turns)
+        assert [turn.paragraphs for turn in redacted] == [["Hi [NAME]"]] * 5
+        assert analyzer.texts == ["Hi Alice"]
+        assert summary.entity_counts == {"PERSON": 5}
+        redact_turns(turns)
+        assert analyzer.texts == ["Hi Alice"]
+
+    def test_cache_evicts_least_recently_used(self, analyzer, monkeypatch):
+        monkeypatch.setattr(privacy, "_PRESIDIO_CACHE_SIZE", 2)
+        for text in ("Alice 1", "Alice 2", "Alice 3"):
+            redact_turns([_paragraphs_turn(text)])
+        assert len(privacy._PRESIDIO_CACHE) == 2
+        redact_turns([_paragraphs_turn("Alice 3")])
+        assert analyzer.texts == ["Alice 1", "Alice 2", "Alice 3"]
+        redacted, _ = redact_turns([_paragraphs_turn("Alice 1")])
+        assert redacted[0].paragraphs == ["[NAME] 1"]
+        assert analyzer.texts[3:] == ["Alice 1"]
+
+    def test_clear_redaction_cache_drops_presidio_results(self, analyzer):
+        redact_turns([_paragraphs_turn("Hi Alice")])
+        assert privacy._PRESIDIO_CACHE
+        clear_redaction_cache()
+        assert not privacy._PRESIDIO_CACHE
+        redact_turns([_paragraphs_turn("Hi Alice")])
+        assert analyzer.texts == ["Hi Alice", "Hi Alice"]
+
 
 # ── redact_turns (regex only, no presidio) ────────────────────────────────────
 
@@ -68,6 +277,13 @@ class TestRedactTurns:
         assert redacted[0].paragraphs[0] == "This is perfectly safe text with no PII."
         assert summary.regex_count == 0
 
+    def test_returns_clean_turns_unchanged(self):
+        turns = [_turn("Nothing to hide here."), _turn("key: sk-abc123def456ghi789jklm")]
+        redacted, _ = redact_turns(turns, use_presidio=False)
+        assert redacted[0] is turns[0]
+        assert redacted[1] is not turns[1]
+        assert turns[1].paragraphs == ["key: sk-abc123def456ghi789jklm"]
+
     def test_multiple_turns(self):
         turns = [
             _turn("Safe paragraph one.", speaker="user"),
@@ -87,7 +303,65 @@ class TestRedactTurns:
         assert redacted[0].speaker == "user"
         assert redacted[0].speaker_label == "Alex"
 
+    def test_parallel_matches_sequential(self):
+        turns = [
+            _turn(f"Paragraph {i}" if i % 3 else f"key sk-abc123def456ghi789jkl{i:02d}")
+            for i in range(100)
+        ]
+        expected, expected_summary = redact_turns(turns, use_presidio=False)
+        redacted, summary = redact_turns(turns, use_presidio=False, parallelism=3)
+        assert redacted == expected
+        assert summary.regex_count == expected_summary.regex_count == 34
+        assert redacted[1] is turns[1]
+
+    def test_long_paragraph_not_cached(self):
+        clear_redaction_cache()
+        para = "log line\n" * 8000 + "SSN is 123-45-6789"
+        redacted, summary = redact_turns([_turn(para)], use_presidio=False)
+        assert redacted[0].paragraphs[0].endswith("SSN is [REDACTED_SSN]")
+        assert summary.regex_count == 1
+        assert _apply_regex.cache_info().currsize == 0
+
     def test_empty_turns(self):
         redacted, summary = redact_turns([], use_presidio=False)
         assert redacted == []
         assert summary.regex_count == 0
+
+
+class TestRedactTurnsBatch:
+    def test_matches_redact_turns(self):
+        turns = [
+            _turn("Safe paragraph one.", speaker="user"),
+            Turn(
+                speaker="assistant",
+                paragraphs=["SSN 123-45-6789", "ok", "Bearer abc.def"],
+                speaker_label="Assistant",
+            ),
+            _turn("Card: 4111 1111 1111 1111"),
+        ]
+        expected, expected_summary = redact_turns(turns, use_presidio=False)
+        redacted, summary = redact_turns_batch(turns, use_presidio=False)
+        assert redacted == expected
+        assert redacted[0] is turns[0]
+        assert summary.regex_count == expected_summary.regex_count == 3
+
+    def test_keeps_unchanged_paragraph_objects(self):
+        # Built at runtime so the identity check below isn't satisfied by interning
+        clean = "".join(["Nothing ", "sensitive here."])  # noqa: FLY002
+        turns = [
+            Turn(
+                speaker="user",
+                paragraphs=[clean, "SSN 123-45-6789"],
+                speaker_label="User",
+            )
+        ]
+        for redact in (redact_turns, redact_turns_batch):
+            redacted, _ = redact(turns, use_presidio=False)
+            assert redacted[0].paragraphs[0] is clean
+            assert redacted[0].paragraphs[1] == "SSN [REDACTED_SSN]"
+
+    def test_match_across_paragraphs_falls_back(self):
+        turns = [Turn(speaker="user", paragraphs=["password:", "next"], speaker_label="User")]
+        redacted, summary = redact_turns_batch(turns, use_presidio=False)
+        assert redacted[0].paragraphs == ["password:", "next"]
+        assert summary.regex_count == 0
@@ -0,0 +1,114 @@
+"""Tests for the references module."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from convo import references
+from convo.parser import Turn
+from convo.references import Reference, collect_references, resolve_youtube
+
+URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+VIDEO_ID = "dQw4w9WgXcQ"
+METADATA = {"title": "Never Gonna Give You Up", "channel": "Rick Astley", "duration": 213}
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the metadata cache at a temp file, starting from nothing loaded."""
+    path = tmp_path / "yt.json"
+    monkeypatch.setattr(references, "_CACHE_PATH", path)
+    monkeypatch.setattr(references, "_cache", None)
+    return path
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Stub out yt-dlp; the returned list records every URL fetched."""
+    urls = []
+
+    def fetch(url):
+        urls.append(url)
+        return METADATA
+
+    monkeypatch.setattr(references, "_fetch_metadata", fetch)
+    return urls
+
+
+class TestMetadataCache:
+    def test_hit_skips_fetch(self, cache_file, fetches, monkeypatch):
+        first = resolve_youtube(URL)
+        # A later run reads the entry back from disk
+        monkeypatch.setattr(references, "_cache", None)
+        second = resolve_youtube(f"https://youtu.be/{VIDEO_ID}")
+        assert fetches == [URL]
+        assert (second.title, second.channel, second.duration) == (
+            "Never Gonna Give You Up",
+            "Rick Astley",
+            "3:33",
+        )
+        assert second.title == first.title
+
+    def test_expired_entry_is_refetched(self, cache_file, fetches):
+        fetched = time.time() - references._CACHE_TTL - 1
+        cache_file.write_text(json.dumps({VIDEO_ID: {"title": "Old", "fetched": fetched}}))
+        assert resolve_youtube(URL).title == "Never Gonna Give You Up"
+        assert fetches == [URL]
+        assert json.loads(cache_file.read_text())[VIDEO_ID]["fetched"] > fetched
+
+    def test_corrupt_file_is_a_miss(self, cache_file, fetches):
+        cache_file.write_text("{not json")
+        assert resolve_youtube(URL).title == "Never Gonna Give You Up"
+        assert fetches == [URL]
+        assert VIDEO_ID in json.loads(cache_file.read_text())
+
+    def test_non_dict_entry_is_a_miss(self, cache_file, fetches):
+        cache_file.write_text(json.dumps({VIDEO_ID: "Never Gonna Give You Up"}))
+        assert resolve_youtube(URL).channel == "Rick Astley"
+        assert fetches == [URL]
+
+    def test_path_follows_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(references, "_CACHE_PATH", None)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert references._cache_path() == tmp_path / "convo" / "yt.json"
+        monkeypatch.setenv("XDG_CACHE_HOME", "relative")
+        assert references._cache_path() == Path.home() / ".cache" / "convo" / "yt.json"
+
+
+class TestCollectReferences:
+    def test_keeps_order_and_dedupes(self, monkeypatch):
+        # Earlier lookups finish last, so completion order is the reverse of input order
+        delays = {"aaaaaaaaaaa": 0.15, "bbbbbbbbbbb": 0.1, "ccccccccccc": 0.05, "ddddddddddd": 0}
+
+        def resolve(url):
+            vid = references._video_id(url)
+            time.sleep(delays[vid])
+            return Reference(url=url, title=vid)
+
+        monkeypatch.setattr(references, "resolve_youtube", resolve)
+        turns = [
+            Turn(
+                speaker="user",
+                paragraphs=[
+                    "see https://youtu.be/ccccccccccc and https://youtu.be/aaaaaaaaaaa",
+                    "again https://www.youtube.com/watch?v=bbbbbbbbbbb",
+                    "and https://youtu.be/ddddddddddd",
+                ],
+                speaker_label="User",
+            )
+        ]
+        cli_refs = [
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+            "https://example.com/post",
+            "https://youtu.be/bbbbbbbbbbb",
+        ]
+        refs = collect_references(turns, cli_refs)
+        assert [(ref.title, ref.source) for ref in refs] == [
+            ("aaaaaaaaaaa", "cli"),
+            ("https://example.com/post", "cli"),
+            ("bbbbbbbbbbb", "cli"),
+            ("ccccccccccc", "conversation"),
+            ("ddddddddddd", "conversation"),
+        ]
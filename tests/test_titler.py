@@ -0,0 +1,47 @@
+"""Tests for the titler module, against a fake ollama on PATH."""
+
+import pytest
+
+from convo import titler
+from convo.parser import Turn
+from convo.titler import generate_title
+
+TURNS = [Turn(speaker="user", paragraphs=["Let's plan the garden."], speaker_label="User")]
+
+
+@pytest.fixture
+def fake_ollama(tmp_path, monkeypatch):
+    """Install an ollama script that runs the given shell body."""
+
+    def install(body: str) -> None:
+        script = tmp_path / "ollama"
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("PATH", str(tmp_path), prepend=":")
+
+    return install
+
+
+class TestGenerateTitle:
+    def test_first_line_of_chatty_model(self, fake_ollama):
+        fake_ollama("echo '\"Garden Planning.\"'; echo 'More chatter'; exec sleep 5")
+        assert generate_title(TURNS) == "Garden Planning"
+
+    def test_unterminated_line(self, fake_ollama):
+        fake_ollama("printf 'Garden Pla'")
+        assert generate_title(TURNS) is None
+
+    def test_failed_run(self, fake_ollama):
+        # The line arrives after the run has already exited with an error
+        fake_ollama("(sleep 0.2; echo 'Error: model not found') & exit 1")
+        assert generate_title(TURNS) is None
+
+    def test_timed_out_run(self, fake_ollama, monkeypatch):
+        monkeypatch.setattr(titler, "_TIMEOUT", 0.1)
+        # Written by a child that outlives the killed model
+        fake_ollama("(sleep 0.5; echo 'Late Title') & exec sleep 5")
+        assert generate_title(TURNS) is None
+
+    def test_no_output(self, fake_ollama):
+        fake_ollama("exit 0")
+        assert generate_title(TURNS) is None